@@ -1,37 +1,168 @@
 import os
+import sys
+import math
+import ctypes
 import sounddevice as sd
 import numpy as np
 import threading
+import queue
 import time
 import wave
+import struct
+from concurrent.futures import ThreadPoolExecutor, CancelledError, TimeoutError
 import groq
-from io import BytesIO
+import io
 import argparse
 import pyautogui  # For keyboard emulation
 
+# Optional faster text injection backends
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+try:
+    import Quartz
+except ImportError:
+    Quartz = None
+
 groq_client = groq.Client()
 
+def warm_up_groq():
+    """Open a connection to the Groq API ahead of the first transcription"""
+    try:
+        groq_client.models.list()
+    except Exception:
+        pass  # Any real problem is reported by the transcription request
+
+# RIFF header for 16-bit mono PCM; only the sizes and sample rate vary
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+def wav_header(data_size, sample_rate):
+    """Build the 44-byte WAV header for data_size bytes of 16-bit mono PCM"""
+    return WAV_HEADER.pack(b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, 1,
+                           sample_rate, sample_rate * 2, 2, 16, b'data', data_size)
+
+class WavReader(io.RawIOBase):
+    """Read-only file serving a WAV header followed by int16 samples, without copying the samples"""
+    def __init__(self, audio_data, sample_rate):
+        self._data = memoryview(np.ascontiguousarray(audio_data)).cast('B')
+        self._header = wav_header(len(self._data), sample_rate)
+        self._size = len(self._header) + len(self._data)
+        self._pos = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def tell(self):
+        return self._pos
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+    
+    def readinto(self, b):
+        out = memoryview(b).cast('B')
+        header_size = len(self._header)
+        pos = self._pos
+        n = 0
+        if pos < header_size:
+            n = min(header_size - pos, len(out))
+            out[:n] = self._header[pos:pos + n]
+            pos += n
+        if pos >= header_size:
+            start = pos - header_size
+            take = max(0, min(len(self._data) - start, len(out) - n))
+            out[n:n + take] = self._data[start:start + take]
+            n += take
+            pos += take
+        self._pos = pos
+        return n
+
+def _voiced_scan(cs2, first, end, window, threshold):
+    count = 0
+    last = -1
+    for k in range(first, end + 1):
+        if cs2[k] - cs2[k - window] > threshold:
+            count += 1
+            last = k
+    return count, last
+
+def _voiced_numpy(cs2, first, end, window, threshold):
+    energy = cs2[first:end + 1] - cs2[first - window:end + 1 - window]
+    voiced = np.flatnonzero(energy > threshold)
+    return int(voiced.size), (first + int(voiced[-1]) if voiced.size else -1)
+
+# voiced_samples(cs2, first, end, window, threshold) checks each sample k in [first, end]
+# for window energy cs2[k] - cs2[k - window] above threshold, and returns how many
+# are voiced and the last one that is (or -1). The NumPy version is used until
+# compile_silence_gate has a Numba build ready
+voiced_samples = _voiced_numpy
+
+def compile_silence_gate():
+    """JIT-compile the silence gate with Numba, if installed, and switch to it"""
+    global voiced_samples
+    # Importing numba alone takes seconds on a Pi, so this runs in the background
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    compiled = njit(cache=True)(_voiced_scan)
+    compiled(np.zeros(2, dtype=np.int64), 1, 1, 1, 0.0)
+    voiced_samples = compiled
+
+# Level meter bars, prebuilt so redrawing the meter doesn't build strings
+LEVEL_BARS = ['|' * i for i in range(51)]
+
+def format_level(level):
+    """Format a volume level as a text meter line"""
+    return f"Level: {level:.4f} {LEVEL_BARS[min(int(level * 50), 50)]}"
+
 def list_audio_devices():
     """List all available audio input devices"""
     devices = sd.query_devices()
+    default_name = sd.query_devices(kind='input')['name']
     print("\nAVAILABLE AUDIO INPUT DEVICES:")
     print("-" * 50)
     for i, device in enumerate(devices):
         if device['max_input_channels'] > 0:  # Only show input devices
-            default = " (DEFAULT)" if device['name'] == sd.query_devices(kind='input')['name'] else ""
+            default = " (DEFAULT)" if device['name'] == default_name else ""
             print(f"{i}: {device['name']}{default} - {device['max_input_channels']} channels")
     print("-" * 50)
     return devices
 
+# Background noise is measured over the first half second of each recording, and the
+# silence threshold is raised to this multiple of the measured noise floor
+CALIBRATION_TIME = 0.5
+NOISE_MARGIN = 1.5
+
 class SpeechRecognizer:
-    def __init__(self, silence_threshold=0.004, silence_timeout=3.0, sample_rate=16000, device=None, debug=False):
+    def __init__(self, silence_threshold=0.004, silence_timeout=3.0, utterance_pause=0.3, min_speech=0.2, max_duration=300, calibrate=True, sample_rate=16000, device=None, debug=False):
         self.silence_threshold = silence_threshold
         self.silence_timeout = silence_timeout
+        self.utterance_pause = utterance_pause
+        self.min_speech = min_speech  # Seconds of voiced audio needed before an utterance is transcribed
+        self.max_duration = max_duration  # Longest recording in seconds; it stops when the buffer fills
         self.sample_rate = sample_rate
+        self.window = int(0.03 * sample_rate)  # Samples per silence detection window
+        self.calibrate = calibrate  # Raise the threshold to the noise floor measured as recording starts
         self.recording = False
-        self.audio_data = []
+        self._done = threading.Event()  # Set once silence has ended the recording
+        self._buf = np.empty(0, dtype=np.int16)
+        self._cs2 = np.zeros(1, dtype=np.int64)
+        self._n = 0
         self.device = device  # Can be None (default), or device index
         self.debug = debug
+        # Each utterance is transcribed in the background as soon as a pause ends it;
+        # the futures are queued in the order spoken and a None marks the end of each
+        # recording. The queue lives as long as the recognizer so a reader can start
+        # waiting on it before recording begins
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self.transcriptions = queue.SimpleQueue()
+        self.cancelled = threading.Event()  # Set to stop handing out transcriptions
         
     def test_audio_input(self, duration=5):
         """Test the selected audio input by recording for a few seconds and displaying levels"""
@@ -44,19 +175,29 @@ class SpeechRecognizer:
         
         audio_data = []
         levels = []
+        errors = []
         
+        # No printing on the realtime thread; the meter is redrawn from here instead
         def callback(indata, frames, time_info, status):
             if status:
-                print(f"Error: {status}")
-            volume_norm = np.linalg.norm(indata) / frames
+                errors.append(status)
+            samples = np.frombuffer(indata, dtype=np.int16).astype(np.int64)
+            volume_norm = math.sqrt(int(samples @ samples)) / frames / 32768.0
             levels.append(volume_norm)
-            audio_data.append(indata.copy())
-            bars = int(volume_norm * 50)
-            print(f"Level: {volume_norm:.4f} {'|' * bars}", end="\r")
+            audio_data.append(bytes(indata))
             
         try:
-            with sd.InputStream(callback=callback, channels=1, samplerate=self.sample_rate, device=self.device):
-                time.sleep(duration)
+            with sd.RawInputStream(callback=callback, channels=1, samplerate=self.sample_rate, device=self.device,
+                                   blocksize=512, latency='low', dtype='int16'):
+                end = time.monotonic() + duration
+                reported = 0
+                while time.monotonic() < end:
+                    time.sleep(1 / 15)
+                    while reported < len(errors):
+                        print(f"Error: {errors[reported]}")
+                        reported += 1
+                    if levels:
+                        print(format_level(levels[-1]), end="\r")
         except Exception as e:
             print(f"\nError testing audio input: {e}")
             return False
@@ -82,54 +223,139 @@ class SpeechRecognizer:
             
             # Save the test audio
             if audio_data and self.debug:
-                combined = np.concatenate(audio_data, axis=0)
+                combined = np.frombuffer(b''.join(audio_data), dtype=np.int16)
                 self.save_debug_audio(combined, "audio_test.wav")
                 print("Test audio saved to 'audio_test.wav'")
             
             return True
         
+    def calibrate_threshold(self, cs2):
+        """Raise the silence threshold above the background noise floor, given a running sum of squares"""
+        # Level of every detection window, in the same units as the threshold. A low
+        # percentile ignores any speech or clicks that fall inside the calibration period
+        levels = np.sqrt(cs2[self.window:] - cs2[:-self.window]) / self.window / 32768.0
+        noise_floor = float(np.percentile(levels, 10)) * NOISE_MARGIN if levels.size else 0.0
+        self.silence_threshold = max(self.silence_threshold, noise_floor)
+        
+        if self.debug:
+            print(f"Noise floor: {noise_floor:.4f}, silence threshold: {self.silence_threshold:.4f}")
+        return self.silence_threshold
+    
     def record_with_silence_detection(self):
         self.recording = True
-        self.audio_data = []
-        last_sound_time = time.time()
+        self._done.clear()
+        # Preallocate the whole recording so the callback can copy straight into it
+        # without ever allocating or resizing on the realtime thread
+        self._buf = np.empty(int(self.sample_rate * (self.silence_timeout + self.max_duration)), dtype=np.int16)
+        raw = memoryview(self._buf).cast('B')
+        # Running sum of squared samples (_cs2[k] covers the first k samples), so the
+        # energy of any window is one subtraction regardless of callback size.
+        # It is only touched by the consumer thread, so it starts at ~30s and grows
+        self._cs2 = np.zeros(self.sample_rate * 30 + 1, dtype=np.int64)
+        self._n = 0
+        window = self.window
+        # Same volume measure as the level meter (norm / samples), squared to skip the sqrt
+        window_threshold = (self.silence_threshold * window * 32768.0) ** 2
+        # The noise floor is measured from the start of the recording itself, so nothing
+        # said during calibration is lost; until then the configured threshold applies
+        calibration_end = int(CALIBRATION_TIME * self.sample_rate) if self.calibrate else None
+        utterance_start = 0
+        utterance_voiced = 0  # Voiced samples in the pending utterance
+        min_voiced = int(self.min_speech * self.sample_rate)
+        in_utterance = False
+        last_sound_time = time.monotonic()
         peak_volume = 0
+        level = 0.0
+        chunks = queue.SimpleQueue()
         
+        # Keep the PortAudio callback down to a copy into the buffer and a queue put;
+        # anything heavier on the realtime thread risks dropouts
         def audio_callback(indata, frames, time_info, status):
-            if status and self.debug:
-                print(f"Status: {status}")
+            if not self.recording:
+                return
+            n = self._n
+            end = min(n + frames, self._buf.size)
+            raw[2 * n:2 * end] = memoryview(indata)[:2 * (end - n)]
+            self._n = end
+            chunks.put_nowait((n, end, time.monotonic(), status))
+        
+        def consumer():
+            nonlocal last_sound_time, peak_volume, level, utterance_start, utterance_voiced, in_utterance
+            nonlocal window_threshold, calibration_end
+            while True:
+                item = chunks.get()
+                if item is None:
+                    break
+                n, end, timestamp, status = item
+                if status and self.debug:
+                    print(f"Status: {status}")
+                if not self.recording or end == n:
+                    continue
                 
-            nonlocal last_sound_time, peak_volume
-            volume_norm = np.linalg.norm(indata) / frames
-            peak_volume = max(peak_volume, volume_norm)
-            
-            # Visual volume indicator (only in debug mode)
-            if self.debug:
-                bars = int(volume_norm * 50)
-                print(f"Level: {volume_norm:.4f} {'|' * bars}", end="\r")
-            
-            if self.recording:
-                self.audio_data.append(indata.copy())
+                squares = self._buf[n:end].astype(np.int64) ** 2
+                volume_norm = math.sqrt(int(squares.sum())) / (end - n) / 32768.0
+                peak_volume = max(peak_volume, volume_norm)
+                level = volume_norm
+                
+                if end >= self._cs2.size:
+                    self._cs2 = np.resize(self._cs2, min(self._cs2.size * 2, self._buf.size + 1))
+                np.cumsum(squares, out=self._cs2[n + 1:end + 1])
+                self._cs2[n + 1:end + 1] += self._cs2[n]
+                
+                if calibration_end is not None and end >= calibration_end:
+                    self.calibrate_threshold(self._cs2[:end + 1])
+                    window_threshold = (self.silence_threshold * window * 32768.0) ** 2
+                    calibration_end = None
+                
+                # If any 30ms window ending in this chunk is loud enough, backdate the
+                # last sound time to the sample where that window ends
+                first = max(n + 1, window)
+                if first <= end:
+                    count, voiced = voiced_samples(self._cs2, first, end, window, window_threshold)
+                    if count:
+                        last_sound_time = timestamp - (end - voiced) / self.sample_rate
+                        utterance_voiced += count
+                        in_utterance = True
                 
-                # If sound detected, update the last sound time
-                if volume_norm > self.silence_threshold:
-                    last_sound_time = time.time()
-                # If silent for too long, stop recording
-                elif (time.time() - last_sound_time > self.silence_timeout):
+                silence = timestamp - last_sound_time
+                # Stop if silent for too long or out of room
+                stopping = silence > self.silence_timeout or end == self._buf.size
+                # A short pause ends the current utterance; send it off while we keep listening.
+                # Too little speech (a click or a cough) is held back and merged into the next
+                # utterance, as Whisper tends to hallucinate text on near-silent clips
+                if in_utterance and (silence >= self.utterance_pause or stopping):
+                    if utterance_voiced >= min_voiced:
+                        self.submit_transcription(self._buf[utterance_start:end])
+                        utterance_start = end
+                        utterance_voiced = 0
+                    in_utterance = False
+                if stopping:
                     self.recording = False
+                    self._done.set()
         
         if self.debug:
-            print("Listening... (speak or press Ctrl+C to stop)")
+            print("Listening... Speak now (or press Ctrl+C to stop)")
         else:
-            print("Listening...")
+            print("Listening... Speak now...")
             
+        worker = threading.Thread(target=consumer, daemon=True)
+        worker.start()
         try:
-            with sd.InputStream(callback=audio_callback, channels=1, samplerate=self.sample_rate, device=self.device):
-                while self.recording:
-                    time.sleep(0.1)
+            with sd.RawInputStream(callback=audio_callback, channels=1, samplerate=self.sample_rate, device=self.device,
+                                   blocksize=512, latency='low', dtype='int16'):
+                # Wait with a timeout so Ctrl+C still gets through on Windows
+                while not self._done.wait(1 / 15 if self.debug else 0.5):
+                    # Visual volume indicator (only in debug mode)
+                    if self.debug:
+                        print(format_level(level), end="\r")
         except Exception as e:
             if self.debug:
                 print(f"\nError recording audio: {e}")
             return None
+        finally:
+            chunks.put(None)
+            worker.join()
+            self.transcriptions.put(None)
         
         if self.debug:
             print(f"\nRecording finished. Peak volume: {peak_volume:.4f}")
@@ -137,10 +363,10 @@ class SpeechRecognizer:
             if peak_volume < 0.004:
                 print("WARNING: Very little audio was detected. Check your microphone.")
             
-        if self.audio_data:
-            audio = np.concatenate(self.audio_data, axis=0)
+        if self._n:
+            audio = self._buf[:self._n]
             if self.debug:
-                max_amplitude = np.max(np.abs(audio))
+                max_amplitude = np.max(np.abs(audio.astype(np.int32))) / 32768.0
                 print(f"Max audio amplitude: {max_amplitude:.4f}")
             return audio
         else:
@@ -148,15 +374,8 @@ class SpeechRecognizer:
     
     def transcribe_with_groq(self, audio_data):
         """Transcribe audio using Groq's Whisper API with better error reporting"""
-        # Save audio to in-memory file
-        wav_bytes = BytesIO()
-        with wave.open(wav_bytes, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(self.sample_rate)
-            wf.writeframes((audio_data * 32767).astype(np.int16).tobytes())
-        
-        wav_bytes.seek(0)
+        # Stream the samples straight from the record buffer behind a WAV header
+        wav_bytes = WavReader(audio_data, self.sample_rate)
         
         try:
             # Add debugging info
@@ -182,6 +401,37 @@ class SpeechRecognizer:
                 print(f"Transcription error: {e}")
             return None
     
+    def submit_transcription(self, audio_data):
+        """Start transcribing an utterance in the background"""
+        if not self.cancelled.is_set():
+            self.transcriptions.put(self._executor.submit(self.transcribe_with_groq, audio_data))
+    
+    def cancel_transcriptions(self):
+        """Drop queued transcriptions and make iter_transcriptions return"""
+        self.cancelled.set()
+        # Requests already in flight finish, but their text is never handed out
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def iter_transcriptions(self):
+        """Yield each utterance's text in the order spoken, as soon as it is available"""
+        # Poll so a cancellation is noticed while waiting on the queue or a request
+        while not self.cancelled.is_set():
+            try:
+                future = self.transcriptions.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if future is None:
+                return
+            while not self.cancelled.is_set():
+                try:
+                    text = future.result(timeout=0.5)
+                except TimeoutError:
+                    continue
+                except CancelledError:
+                    return
+                yield text
+                break
+    
     def save_debug_audio(self, audio_data, filename="debug_audio.wav"):
         """Save the recorded audio to a file for debugging"""
         if audio_data is not None and self.debug:
@@ -189,20 +439,123 @@ class SpeechRecognizer:
                 wf.setnchannels(1)
                 wf.setsampwidth(2)
                 wf.setframerate(self.sample_rate)
-                wf.writeframes((audio_data * 32767).astype(np.int16).tobytes())
+                wf.writeframes(audio_data.tobytes())
             print(f"Saved debug audio to {filename}")
 
 
+# Above this length, pasting from the clipboard beats typing character by character
+PASTE_THRESHOLD = 100
+
+if sys.platform == 'win32':
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+def _type_sendinput(text):
+    """Inject text on Windows as Unicode key events in a single SendInput call"""
+    units = text.encode('utf-16-le')
+    inputs = (INPUT * len(units))()
+    for i in range(0, len(units), 2):
+        code = units[i] | (units[i + 1] << 8)
+        for j, flags in enumerate((KEYEVENTF_UNICODE, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)):
+            event = inputs[i + j]
+            event.type = INPUT_KEYBOARD
+            event.u.ki.wScan = code
+            event.u.ki.dwFlags = flags
+    ctypes.windll.user32.SendInput(len(inputs), inputs, ctypes.sizeof(INPUT))
+
+
+def _type_quartz(text):
+    """Inject text on macOS as Unicode keyboard events"""
+    # CGEventKeyboardSetUnicodeString only takes about 20 UTF-16 units per event
+    units = text.encode('utf-16-le')
+    start = 0
+    while start < len(units):
+        end = min(start + 40, len(units))
+        # Don't split a surrogate pair across events
+        if end < len(units) and 0xD8 <= units[end - 1] <= 0xDB:
+            end -= 2
+        chunk = units[start:end].decode('utf-16-le')
+        length = (end - start) // 2
+        start = end
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+            Quartz.CGEventKeyboardSetUnicodeString(event, length, chunk)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+
+def _paste(text):
+    """Insert text via the clipboard and a paste shortcut; returns False if there is no clipboard"""
+    # The clipboard is left holding the text: there's no telling when the target
+    # application has finished reading it, so restoring it could paste the old contents
+    try:
+        pyperclip.copy(text)
+    except pyperclip.PyperclipException:
+        return False  # No clipboard backend (e.g. xclip/xsel not installed)
+    pyautogui.hotkey('command' if sys.platform == 'darwin' else 'ctrl', 'v')
+    return True
+
+
 def type_text(text):
-    """Type the transcribed text using pyautogui"""
+    """Type the transcribed text using the fastest injector available"""
     if not text:
         return
         
     # Add a small delay before typing
-    time.sleep(0.3)
+    time.sleep(0.05)
     
     # Type the text
-    pyautogui.write(text)
+    if sys.platform == 'win32':
+        _type_sendinput(text)
+    elif sys.platform == 'darwin' and Quartz is not None:
+        _type_quartz(text)
+    elif pyperclip is None or len(text) <= PASTE_THRESHOLD or not _paste(text):
+        pyautogui.write(text)
+
+
+def type_transcriptions(recognizer, debug=False, dry_run=False):
+    """Print and type each utterance as its transcription completes"""
+    utterances = 0
+    typed = False
+    for text in recognizer.iter_transcriptions():
+        utterances += 1
+        if not text or not text.strip():
+            continue
+        
+        text = text.strip()
+        if debug:
+            print(f"Transcription: {text}")
+        else:
+            print(f"Typing: {text}")
+        
+        if not dry_run:
+            # Separate consecutive utterances with a space
+            type_text(" " + text if typed else text)
+        typed = True
+    
+    if recognizer.cancelled.is_set():
+        return
+    if utterances == 0:
+        print("No speech detected")
+    elif not typed:
+        print("Transcription failed")
 
 
 def main():
@@ -214,6 +567,10 @@ def main():
     parser.add_argument('--test', action='store_true', help='Test audio input without typing')
     parser.add_argument('--threshold', type=float, default=0.004, help='Silence threshold (default: 0.004)')
     parser.add_argument('--timeout', type=float, default=3.0, help='Silence timeout in seconds (default: 3.0)')
+    parser.add_argument('--pause', type=float, default=0.3, help='Pause in seconds that ends an utterance and sends it for transcription (default: 0.3)')
+    parser.add_argument('--min-speech', type=float, default=0.2, help='Seconds of speech needed before an utterance is transcribed (default: 0.2)')
+    parser.add_argument('--max-duration', type=float, default=300, help='Maximum recording length in seconds (default: 300)')
+    parser.add_argument('--no-calibrate', action='store_true', help='Use the threshold as given instead of raising it to the measured background noise')
     args = parser.parse_args()
     
     # If only listing devices is requested
@@ -221,10 +578,18 @@ def main():
         list_audio_devices()
         return
     
+    # Get the TLS handshake out of the way while the microphone is being set up
+    threading.Thread(target=warm_up_groq, daemon=True).start()
+    threading.Thread(target=compile_silence_gate, daemon=True).start()
+    
     # Create recognizer with selected device
     recognizer = SpeechRecognizer(
         silence_threshold=args.threshold,
         silence_timeout=args.timeout,
+        utterance_pause=args.pause,
+        min_speech=args.min_speech,
+        max_duration=args.max_duration,
+        calibrate=not args.no_calibrate,
         device=args.device,
         debug=args.debug
     )
@@ -238,30 +603,28 @@ def main():
                 print("Exiting. Please check your microphone settings.")
                 return
     
+    # Type utterances as they come back while recording carries on. The typist is
+    # always joined (with a timeout, so Ctrl+C works on Windows) rather than left to
+    # interpreter shutdown, which could cut it off mid-word
+    typist = threading.Thread(target=type_transcriptions, args=(recognizer, args.debug, args.test))
+    typist.start()
     try:
-        print("Ready to record. Speak now...")
+        print("Ready to record.")
         audio_data = recognizer.record_with_silence_detection()
         if audio_data is not None and len(audio_data) > 0:
             # Save audio for debugging
             if args.debug:
                 recognizer.save_debug_audio(audio_data)
-            
-            text = recognizer.transcribe_with_groq(audio_data)
-            if text:
-                if args.debug:
-                    print(f"Transcription: {text}")
-                else:
-                    print(f"Typing: {text}")
-                
-                if not args.test:
-                    type_text(text)
-            else:
-                print("Transcription failed")
         else:
             print("No audio recorded")
+        while typist.is_alive():
+            typist.join(0.5)
     except KeyboardInterrupt:
         print("\nStopped by user")
         recognizer.recording = False
+        recognizer.cancel_transcriptions()
+        while typist.is_alive():
+            typist.join(0.5)
 
 
 if __name__ == "__main__":